@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+import fields_extract as fe
+
+def prefilter_misses(text: str) -> list[int]:
+    hits = fe._prefilter_hits(text)
+    return [pid for pid, pat in enumerate(fe._ALL_PATS) if pid not in hits and pat.search(text)]
+
+def check_prefilter(json_files: list[Path]) -> int:
+    misses = 0
+    for path in json_files:
+        _, _, texts, _ = fe.load_json(path)
+        for idx, text in enumerate(texts):
+            missed = prefilter_misses(text)
+            if missed:
+                misses += 1
+                print(f'  prefilter miss: {path.name} page text {idx}: patterns {missed}')
+    return misses
+
+def main() -> None:
+    json_files = [path for path, _ in fe.list_json_files(fe.EXTRACTED_DIR)]
+    misses = check_prefilter(json_files)
+    print(f'Prefilter check: {misses} page text(s) with misses across {len(json_files)} file(s)')
+    sys.exit(1 if misses else 0)
+if __name__ == '__main__':
+    main()
@@ -1,123 +1,293 @@
+import os
 import re
 import json
 import sqlite3
+import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import dropwhile
 from pathlib import Path
+from typing import Any, Iterable
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except Exception:
+    HYPERSCAN_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except Exception:
+    AHOCORASICK_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except Exception:
+    IJSON_AVAILABLE = False
 EXTRACTED_DIR = 'extracted_data'
 DB_PATH = 'oil_wells.db'
-DDL = '\nCREATE TABLE IF NOT EXISTS wells (\n    api_number   TEXT PRIMARY KEY,\n    well_name    TEXT,\n    well_number  TEXT,\n    operator     TEXT,\n    county       TEXT,\n    state        TEXT,\n    shl_desc     TEXT,\n    latitude     REAL,\n    longitude    REAL,\n    datum        TEXT,\n    pdf_filename TEXT\n);\n\nCREATE TABLE IF NOT EXISTS stimulation (\n    stimulation_id INTEGER PRIMARY KEY AUTOINCREMENT,\n    api_number     TEXT REFERENCES wells(api_number),\n    date_stimulated TEXT,\n    formation      TEXT,\n    top_ft         REAL,\n    bottom_ft      REAL,\n    stages         INTEGER,\n    volume         REAL,\n    volume_units   TEXT,\n    treatment_type TEXT,\n    acid_percent   REAL,\n    lbs_proppant   REAL,\n    max_pressure   REAL,\n    max_rate       REAL,\n    details        TEXT\n);\n'
+BATCH_SIZE = 500
+HEADER_KEYS = ('pdf_filename', 'well_name')
+JSON_SCALAR_EVENTS = frozenset(('string', 'number', 'boolean', 'null'))
+STIM_WINDOW_CHARS = 8192
+STREAM_MIN_BYTES = 64 * 1024 * 1024
+DDL = '\nCREATE TABLE IF NOT EXISTS wells (\n    api_number   TEXT PRIMARY KEY,\n    well_name    TEXT,\n    well_number  TEXT,\n    operator     TEXT,\n    county       TEXT,\n    state        TEXT,\n    shl_desc     TEXT,\n    latitude     REAL,\n    longitude    REAL,\n    datum        TEXT,\n    pdf_filename TEXT\n);\n\nCREATE TABLE IF NOT EXISTS stimulation (\n    stimulation_id INTEGER PRIMARY KEY AUTOINCREMENT,\n    api_number     TEXT REFERENCES wells(api_number),\n    date_stimulated TEXT,\n    formation      TEXT,\n    top_ft         REAL,\n    bottom_ft      REAL,\n    stages         INTEGER,\n    volume         REAL,\n    volume_units   TEXT,\n    treatment_type TEXT,\n    acid_percent   REAL,\n    lbs_proppant   REAL,\n    max_pressure   REAL,\n    max_rate       REAL,\n    details        TEXT\n);\n\nCREATE INDEX IF NOT EXISTS idx_wells_name ON wells(well_name);\nCREATE INDEX IF NOT EXISTS idx_stim_api ON stimulation(api_number);\n'
 
 def create_tables(conn: sqlite3.Connection) -> None:
     conn.executescript(DDL)
     conn.commit()
 
-def collect_page_data(pages: list[dict]) -> tuple[dict, list[str]]:
+def collect_page_data(pages: Iterable[dict]) -> tuple[dict, list[str], list[dict]]:
     merged_fields: dict = {}
     all_texts: list[str] = []
+    page_fields: list[dict] = []
     for page in pages:
         text = page.get('text', '')
-        if text.strip():
+        if text and (not text.isspace()):
             all_texts.append(text)
-        merged_fields.update(page.get('fields', {}))
-    return (merged_fields, all_texts)
-
-def _search(patterns: list[re.Pattern], texts: list[str]) -> str | None:
-    for text in texts:
-        for pat in patterns:
-            m = pat.search(text)
-            if m:
-                val = re.sub('\\s+', ' ', m.group(1)).strip()
-                if val:
-                    return val
+        fields = page.get('fields')
+        if fields:
+            page_fields.append(fields)
+            merged_fields.update(fields)
+    return (merged_fields, all_texts, page_fields)
+
+def load_json(json_path: Path) -> tuple[dict, dict, list[str], list[dict]]:
+    if not IJSON_AVAILABLE or json_path.stat().st_size < STREAM_MIN_BYTES:
+        raw = json_path.read_bytes()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        return (data, *collect_page_data(data.get('pages', [])))
+    header: dict = {}
+    with open(json_path, 'rb') as fh:
+        for prefix, event, value in ijson.parse(fh, use_float=True):
+            if prefix in HEADER_KEYS and event in JSON_SCALAR_EVENTS:
+                header[prefix] = value
+                if len(header) == len(HEADER_KEYS):
+                    break
+    with open(json_path, 'rb') as fh:
+        page_data = collect_page_data(ijson.items(fh, 'pages.item', use_float=True))
+    return (header, *page_data)
+
+def _ws(s: str) -> str:
+    return ' '.join(s.split())
+
+_API_PATS = [(re.compile('API\\s*[#Nn][Oo\\.]*\\s*[:\\s]+([0-9][\\d\\s\\-]{8,19})', re.I), ('api',)), (re.compile('API\\s*:\\s*([0-9][\\d\\s\\-]{8,19})', re.I), ('api',)), (re.compile('\\bAPI\\b\\s*([0-9][\\d\\-]{8,18})', re.I), ('api',))]
+_WNUM_PATS = [(re.compile('NDIC\\s+File\\s+Number\\s*:\\s*(\\d+)', re.I), ('ndic',)), (re.compile('ND\\s+Well\\s+File\\s*#\\s*[:\\s]+(\\d+)', re.I), ('file',)), (re.compile('Well\\s+File\\s+No\\.?\\s*[:\\s]+(\\d+)', re.I), ('file',)), (re.compile('Well\\s+or\\s+Facility\\s+No\\.?\\s*[:\\s]+(\\d+)', re.I), ('facility',))]
+_OP_PATS = [(re.compile('Well\\s+Operator\\s*:\\s*([^\\n]+)', re.I), ('operator',)), (re.compile('^Operator\\s*:\\s*([^\\n]+)', re.I | re.M), ('operator',))]
+_CO_PATS = [(re.compile('^County\\s*:\\s*([A-Za-z ]+?)$', re.I | re.M), ('county',)), (re.compile('County,\\s*State\\s*:\\s*([A-Za-z ]+?)\\s+County', re.I), ('county',))]
+_SHL_PATS = [(re.compile('Well\\s+Surface\\s+Hole\\s+Location\\s*\\(SHL\\)\\s*:\\s*([^\\n]+)', re.I), ('shl',)), (re.compile('Surface\\s+(?:Hole\\s+)?Location\\s*:\\s*([^\\n]+)', re.I), ('surface',)), (re.compile('\\bSHL\\s*:\\s*([^\\n]+)', re.I), ('shl',))]
+_LAT_PATS = [(re.compile("Lat(?:itude)?\\s*[:\\s]+(\\d{1,2}°\\s*\\d{1,2}'\\s*[\\d.]+\\s*[Nn])", re.I), ('lat',)), (re.compile('Lat(?:itude)?\\s*[:\\s]+(\\d{1,3}\\.\\d+)', re.I), ('lat',))]
+_LON_PATS = [(re.compile("Lon(?:gitude)?\\s*[:\\s]+(\\d{1,3}°\\s*\\d{1,2}'\\s*[\\d.]+\\s*[Ww])", re.I), ('lon',)), (re.compile('Lon(?:gitude)?\\s*[:\\s]+(\\d{1,3}\\.\\d+)', re.I), ('lon',))]
+_DATUM_PATS = [(re.compile('Datum\\s*:\\s*([^\\n:]{2,30})', re.I), ('datum',)), (re.compile('(NAD\\s*\\d+|WGS\\s*\\d+)', re.I), ('nad', 'wgs'))]
+_FIELD_PATS = {'api': _API_PATS, 'well_number': _WNUM_PATS, 'operator': _OP_PATS, 'county': _CO_PATS, 'shl': _SHL_PATS, 'latitude': _LAT_PATS, 'longitude': _LON_PATS, 'datum': _DATUM_PATS}
+_ALL_PATS: list[re.Pattern] = []
+_PAT_KEYWORDS: list[tuple[str, ...]] = []
+_FIELD_IDS: dict[str, list[int]] = {}
+for _field, _pats in _FIELD_PATS.items():
+    _FIELD_IDS[_field] = list(range(len(_ALL_PATS), len(_ALL_PATS) + len(_pats)))
+    for _pat, _kws in _pats:
+        if not _kws or not all((kw in _pat.pattern.lower() for kw in _kws)):
+            raise ValueError(f'prefilter keywords {_kws!r} do not appear in {_field} pattern {_pat.pattern!r}')
+        _ALL_PATS.append(_pat)
+        _PAT_KEYWORDS.append(_kws)
+
+def _build_hs_database() -> Any:
+    flags = [hyperscan.HS_FLAG_SINGLEMATCH | (hyperscan.HS_FLAG_CASELESS if pat.flags & re.I else 0) | (hyperscan.HS_FLAG_MULTILINE if pat.flags & re.M else 0) for pat in _ALL_PATS]
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(expressions=[pat.pattern.encode('utf-8') for pat in _ALL_PATS], ids=list(range(len(_ALL_PATS))), elements=len(_ALL_PATS), flags=flags)
+    except hyperscan.error:
+        return None
+    return db
+_HS_DB = _build_hs_database() if HYPERSCAN_AVAILABLE else None
+_HS_ASCII_SPACES = bytes.maketrans(b'\x1c\x1d\x1e\x1f', b'    ')
+
+_KEYWORDS = sorted({kw for kws in _PAT_KEYWORDS for kw in kws})
+
+def _build_keyword_automaton() -> Any:
+    automaton = ahocorasick.Automaton()
+    for kw in _KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+_KEYWORD_AC = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+def _fold(text: str) -> str:
+    folded = text.casefold()
+    if 'ı' in folded:
+        folded = folded.replace('ı', 'i')
+    if '\u0307' in folded:
+        folded = folded.replace('\u0307', '')
+    return folded
+
+def _keyword_hits(text: str) -> set[int]:
+    folded = _fold(text)
+    if _KEYWORD_AC is not None:
+        found = {kw for _, kw in _KEYWORD_AC.iter(folded)}
+    else:
+        found = {kw for kw in _KEYWORDS if kw in folded}
+    return {pid for pid, kws in enumerate(_PAT_KEYWORDS) if any((kw in found for kw in kws))}
+
+def _hs_hits(text: str) -> set[int]:
+    hits: set[int] = set()
+
+    def _on_match(pid: int, start: int, end: int, flags: int, context: Any) -> None:
+        hits.add(pid)
+    _HS_DB.scan(text.encode('ascii').translate(_HS_ASCII_SPACES), match_event_handler=_on_match)
+    return hits
+
+def _prefilter_hits(text: str) -> set[int]:
+    if _HS_DB is not None and text.isascii():
+        return _hs_hits(text)
+    return _keyword_hits(text)
+
+def _first_match(text: str, ids: list[int], hits: set[int] | None) -> str | None:
+    for pid in ids:
+        if hits is not None and pid not in hits:
+            continue
+        m = _ALL_PATS[pid].search(text)
+        if m:
+            val = _ws(m.group(1))
+            if val:
+                return val
     return None
-_API_PATS = [re.compile('API\\s*[#Nn][Oo\\.]*\\s*[:\\s]+([0-9][\\d\\s\\-]{8,19})', re.I), re.compile('API\\s*:\\s*([0-9][\\d\\s\\-]{8,19})', re.I), re.compile('\\bAPI\\b\\s*([0-9][\\d\\-]{8,18})', re.I)]
-_WNUM_PATS = [re.compile('NDIC\\s+File\\s+Number\\s*:\\s*(\\d+)', re.I), re.compile('ND\\s+Well\\s+File\\s*#\\s*[:\\s]+(\\d+)', re.I), re.compile('Well\\s+File\\s+No\\.?\\s*[:\\s]+(\\d+)', re.I), re.compile('Well\\s+or\\s+Facility\\s+No\\.?\\s*[:\\s]+(\\d+)', re.I)]
-_OP_PATS = [re.compile('Well\\s+Operator\\s*:\\s*([^\\n]+)', re.I), re.compile('^Operator\\s*:\\s*([^\\n]+)', re.I | re.M)]
-_CO_PATS = [re.compile('^County\\s*:\\s*([A-Za-z ]+?)$', re.I | re.M), re.compile('County,\\s*State\\s*:\\s*([A-Za-z ]+?)\\s+County', re.I)]
-_SHL_PATS = [re.compile('Well\\s+Surface\\s+Hole\\s+Location\\s*\\(SHL\\)\\s*:\\s*([^\\n]+)', re.I), re.compile('Surface\\s+(?:Hole\\s+)?Location\\s*:\\s*([^\\n]+)', re.I), re.compile('\\bSHL\\s*:\\s*([^\\n]+)', re.I)]
-_LAT_PATS = [re.compile("Lat(?:itude)?\\s*[:\\s]+(\\d{1,2}°\\s*\\d{1,2}'\\s*[\\d.]+\\s*[Nn])", re.I), re.compile('Lat(?:itude)?\\s*[:\\s]+(\\d{1,3}\\.\\d+)', re.I)]
-_LON_PATS = [re.compile("Lon(?:gitude)?\\s*[:\\s]+(\\d{1,3}°\\s*\\d{1,2}'\\s*[\\d.]+\\s*[Ww])", re.I), re.compile('Lon(?:gitude)?\\s*[:\\s]+(\\d{1,3}\\.\\d+)', re.I)]
-_DATUM_PATS = [re.compile('Datum\\s*:\\s*([^\\n:]{2,30})', re.I), re.compile('(NAD\\s*\\d+|WGS\\s*\\d+)', re.I)]
 
+class _FieldScan:
+
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+        self._hits: dict[int, set[int]] = {}
+
+    def _candidates(self, idx: int) -> set[int]:
+        if idx not in self._hits:
+            text = self.texts[idx]
+            self._hits[idx] = _prefilter_hits(text)
+        return self._hits[idx]
+
+    def first(self, field: str, primary: str | None=None) -> str | None:
+        ids = _FIELD_IDS[field]
+        if primary:
+            val = _first_match(primary, ids, None)
+            if val:
+                return val
+        for idx, text in enumerate(self.texts):
+            val = _first_match(text, ids, self._candidates(idx))
+            if val:
+                return val
+        return None
+
+@lru_cache(maxsize=4096)
 def _dms_to_decimal(dms_str: str) -> float | None:
-    m = re.match("(\\d{1,3})\\s*°\\s*(\\d{1,2})'\\s*([\\d.]+)\\s*([NSEWnsew])", dms_str.strip())
-    if not m:
+    deg, _, rest = dms_str.strip().partition('°')
+    mins, _, rest = rest.partition("'")
+    rest = rest.strip()
+    if not rest or rest[-1] not in 'NSEWnsew':
         return None
-    deg, mins, secs, direction = m.groups()
-    dd = float(deg) + float(mins) / 60 + float(secs) / 3600
-    if direction.upper() in ('S', 'W'):
+    try:
+        dd = int(deg) + int(mins) / 60 + float(rest[:-1]) / 3600
+    except ValueError:
+        return None
+    if rest[-1] in 'SWsw':
         dd = -dd
     return round(dd, 7)
 
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+@lru_cache(maxsize=4096)
 def _normalize_api(raw: str) -> str | None:
-    candidate = re.sub('\\s+', '', raw).strip()
-    if re.search('[A-Za-z]', candidate):
-        return None
-    digits = re.sub('[^\\d]', '', raw)
+    digits: list[str] = []
+    for c in raw:
+        if c in _ASCII_LETTERS:
+            return None
+        if c.isdecimal():
+            digits.append(c)
     if len(digits) < 8:
         return None
-    if len(digits) == 14:
-        return f'{digits[:2]}-{digits[2:5]}-{digits[5:10]}-{digits[10:12]}-{digits[12:]}'
-    if len(digits) == 10:
-        return f'{digits[:2]}-{digits[2:5]}-{digits[5:10]}'
-    return candidate
+    d = ''.join(digits)
+    if len(d) == 14:
+        return f'{d[:2]}-{d[2:5]}-{d[5:10]}-{d[10:12]}-{d[12:]}'
+    if len(d) == 10:
+        return f'{d[:2]}-{d[2:5]}-{d[5:10]}'
+    return ''.join(raw.split())
+
+_WNUM_DIGITS = re.compile('[^\\d]')
+_OP_CUT = re.compile('\\s+(?:Kick-off|Rig|API|Telephone|Well\\s+Name|Job\\s+Type|Enseco)\\s*[#:]|\\s{3,}', re.I)
+_OP_JUNK_START = re.compile('^(?:Kick-off|Rig\\b|Job\\s+Type|Enseco|Well\\s+Name|Telephone)\\s*[#:\\d]', re.I)
+_OP_LEAD = re.compile('^(?P<lead>[a-z]\\s+)?(?:(?P<lo>[a-z])(?P<up>[A-Z]))?')
+_REJECT_NAMES = re.compile('^(?:Well|Lease|Field|County|State|None)$', re.I)
+_COUNTY_SPLIT = re.compile('\\s*(?:State|Section|Township|Directional|:)')
+_COUNTY_OK = re.compile('^[A-Za-z ]{2,30}$')
+_DATUM_NAD83 = re.compile('North\\s+American\\s+Datum\\s+1983', re.I)
+_DATUM_NAD27 = re.compile('North\\s+American\\s+Datum\\s+1927', re.I)
+_DATUM_ELEVATION = re.compile('\\d.*(?:ft|usft|RKB|WELL|@)', re.I)
+_DATUM_PREFIX = re.compile('^((?:NAD|WGS|NAO)\\s*\\d{2,4})', re.I)
+_DATUM_NAO = re.compile('NAO', re.I)
+_DATUM_KNOWN = re.compile('NAD|WGS|North\\s+American|GRS|NAVD', re.I)
+_DATUM_PUNCT = re.compile('[()@\\\\]')
+_WELL_NAME_API = re.compile('\\s+API\\s*:.*$', re.I)
+_WELL_NAME_WFN = re.compile('\\s+Well\\s+File\\s+No\\.?:?.*$', re.I)
+_WELL_NAME_TRAIL = re.compile('\\s+(?:Directional\\s+Drillers|Field|Pad\\s+OD|Company\\s+Man)(?:\\s*:|)\\s*\\S.*$', re.I)
+_WELL_NAME_TRAIL_KEYWORDS = ('directional', 'field', 'pad', 'company')
+_JUNK_NAME = re.compile('(?:^|^.{0,5})(Location|Field\\s*/\\s*Prospect|Directional\\s+Drillers|Mud\\s+Record)\\s*:?$', re.I)
+
+def _fix_lead(m: re.Match) -> str:
+    return m.group('lo').upper() + m.group('up') if m.group('lo') else ''
 
 def extract_well_row(data: dict) -> dict:
-    pages = data.get('pages', [])
-    merged_fields, all_texts = collect_page_data(pages)
-    raw_api = merged_fields.get('API #') or merged_fields.get('API Number') or merged_fields.get('API') or _search(_API_PATS, all_texts)
+    return build_well_row(data, *collect_page_data(data.get('pages', [])))
+
+def build_well_row(data: dict, merged_fields: dict, all_texts: list[str], page_fields: list[dict]) -> dict:
+    scan = _FieldScan(all_texts)
+    raw_api = merged_fields.get('API #') or merged_fields.get('API Number') or merged_fields.get('API') or scan.first('api')
     api = _normalize_api(raw_api) if raw_api else None
 
     def _valid_well_num(val: str | None) -> str | None:
         if not val:
             return None
-        digits = re.sub('[^\\d]', '', val)
+        digits = _WNUM_DIGITS.sub('', val)
         if digits.isdigit() and 1000 <= int(digits) <= 199999:
             return digits
         return None
-    well_number = _valid_well_num(merged_fields.get('NDIC File Number')) or _valid_well_num(merged_fields.get('ND Well File #')) or _valid_well_num(merged_fields.get('Well or Facility No')) or _valid_well_num(_search(_WNUM_PATS, all_texts))
+    well_number = _valid_well_num(merged_fields.get('NDIC File Number')) or _valid_well_num(merged_fields.get('ND Well File #')) or _valid_well_num(merged_fields.get('Well or Facility No')) or _valid_well_num(scan.first('well_number'))
     if not well_number:
-        well_number = re.sub('[^\\d]', '', Path(data.get('pdf_filename', '')).stem)
+        well_number = _WNUM_DIGITS.sub('', Path(data.get('pdf_filename', '')).stem)
     api_key = api if api else f'NDIC-{well_number}' if well_number else 'UNKNOWN'
-    _OP_STOP = re.compile('\\s+(?:Kick-off|Rig|API|Telephone|Well\\s+Name|Job\\s+Type|Enseco)\\s*[#:]', re.I)
-    _OP_JUNK_START = re.compile('^(?:Kick-off|Rig\\b|Job\\s+Type|Enseco|Well\\s+Name|Telephone)\\s*[#:\\d]', re.I)
-
     def _first_valid_operator() -> str | None:
         keys = ('Well Operator', 'Operator')
-        for page in pages:
-            flds = page.get('fields', {})
+        for flds in page_fields:
             for k in keys:
                 val = flds.get(k, '')
                 if not val:
                     continue
                 if _OP_JUNK_START.match(val.strip()):
                     continue
-                cleaned = _OP_STOP.split(val)[0]
-                cleaned = re.split('\\s{3,}', cleaned)[0]
-                cleaned = re.sub('\\s+', ' ', cleaned).strip()
-                cleaned = re.sub('^[a-z]\\s+', '', cleaned)
-                cleaned = re.sub('^([a-z])([A-Z])', lambda m: m.group(1).upper() + m.group(2), cleaned)
+                cut = _OP_CUT.search(val)
+                cleaned = _ws(val[:cut.start()] if cut else val)
+                cleaned = _OP_LEAD.sub(_fix_lead, cleaned, count=1)
                 if cleaned and (not cleaned.endswith(':')) and (len(cleaned) >= 5):
-                    if re.match('^(?:Well|Lease|Field|County|State|None)$', cleaned, re.I):
+                    if _REJECT_NAMES.match(cleaned):
                         continue
                     return cleaned
-        val = _search(_OP_PATS, all_texts)
+        val = scan.first('operator')
         if val and (not val.endswith(':')) and (not _OP_JUNK_START.match(val.strip())):
-            val = re.sub('^[a-z]\\s+', '', val)
-            val = re.sub('^([a-z])([A-Z])', lambda m: m.group(1).upper() + m.group(2), val)
-            if len(val) >= 5 and (not re.match('^(?:Well|Lease|Field|County|State|None)$', val, re.I)):
+            val = _OP_LEAD.sub(_fix_lead, val, count=1)
+            if len(val) >= 5 and (not _REJECT_NAMES.match(val)):
                 return val
         return None
     operator = _first_valid_operator()
-    county = merged_fields.get('County') or _search(_CO_PATS, all_texts)
+    county = merged_fields.get('County') or scan.first('county')
     if county:
-        county = re.split('\\s*(?:State|Section|Township|Directional|:)', county, maxsplit=1)[0]
-        county = re.sub('\\s+', ' ', county).strip().title()
-        if not re.match('^[A-Za-z ]{2,30}$', county):
+        county = _COUNTY_SPLIT.split(county, maxsplit=1)[0]
+        county = _ws(county).title()
+        if not _COUNTY_OK.match(county):
             county = None
-    shl = merged_fields.get('Well Surface Hole Location (SHL)') or merged_fields.get('Surface Location') or merged_fields.get('SHL') or _search(_SHL_PATS, all_texts)
+    shl = merged_fields.get('Well Surface Hole Location (SHL)') or merged_fields.get('Surface Location') or merged_fields.get('SHL') or scan.first('shl')
     lat_field_val = merged_fields.get('Latitude', '')
-    lat_s = _search(_LAT_PATS, [lat_field_val] + all_texts)
-    lon_s = _search(_LON_PATS, [lat_field_val] + all_texts)
+    lat_s = scan.first('latitude', primary=lat_field_val)
+    lon_s = scan.first('longitude', primary=lat_field_val)
 
     def _to_coord(s: str | None) -> float | None:
         if not s:
@@ -137,34 +307,37 @@ def extract_well_row(data: dict) -> dict:
             longitude = -longitude
         elif not -105.0 <= longitude <= -96.0:
             longitude = None
-    datum_raw = merged_fields.get('Datum') or _search(_DATUM_PATS, [lat_field_val] + all_texts)
+    datum_raw = merged_fields.get('Datum') or scan.first('datum', primary=lat_field_val)
 
     def _clean_datum(d: str | None) -> str | None:
         if not d:
             return None
-        d = re.sub('\\s+', ' ', d).strip()
-        if re.search('North\\s+American\\s+Datum\\s+1983', d, re.I):
+        d = _ws(d)
+        if _DATUM_NAD83.search(d):
             return 'NAD83'
-        if re.search('North\\s+American\\s+Datum\\s+1927', d, re.I):
+        if _DATUM_NAD27.search(d):
             return 'NAD27'
-        if re.search('\\d.*(?:ft|usft|RKB|WELL|@)', d, re.I):
+        if _DATUM_ELEVATION.search(d):
             return None
-        m = re.match('^((?:NAD|WGS|NAO)\\s*\\d{2,4})', d.strip(), re.I)
+        m = _DATUM_PREFIX.match(d.strip())
         if m:
-            prefix = re.sub('NAO', 'NAD', m.group(1).strip(), flags=re.I)
+            prefix = _DATUM_NAO.sub('NAD', m.group(1).strip())
             return prefix
-        if re.search('NAD|WGS|North\\s+American|GRS|NAVD', d, re.I):
-            if len(d) <= 25 and (not re.search('[()@\\\\]', d)):
+        if _DATUM_KNOWN.search(d):
+            if len(d) <= 25 and (not _DATUM_PUNCT.search(d)):
                 return d
         return None
     datum = _clean_datum(datum_raw)
     well_name = data.get('well_name', '')
-    well_name = re.sub('[\\s\\u00a0]+', ' ', well_name).strip()
-    well_name = re.sub('\\s+API\\s*:.*$', '', well_name, flags=re.I)
-    well_name = re.sub('\\s+Well\\s+File\\s+No\\.?:?.*$', '', well_name, flags=re.I)
-    well_name = re.sub('\\s+(?:Directional\\s+Drillers|Field|Pad\\s+OD|Company\\s+Man)(?:\\s*:|)\\s*\\S.*$', '', well_name, flags=re.I)
+    well_name = _ws(well_name)
+    folded = _fold(well_name)
+    if ':' in well_name:
+        well_name = _WELL_NAME_API.sub('', well_name)
+    if 'file' in folded:
+        well_name = _WELL_NAME_WFN.sub('', well_name)
+    if any((kw in folded for kw in _WELL_NAME_TRAIL_KEYWORDS)):
+        well_name = _WELL_NAME_TRAIL.sub('', well_name)
     well_name = well_name.strip()
-    _JUNK_NAME = re.compile('(?:^|^.{0,5})(Location|Field\\s*/\\s*Prospect|Directional\\s+Drillers|Mud\\s+Record)\\s*:?$', re.I)
     if well_name.endswith(':') or _JUNK_NAME.match(well_name):
         well_name = ''
     return {'api_number': api_key, 'well_name': well_name, 'well_number': well_number, 'operator': operator, 'county': county, 'state': 'ND', 'shl_desc': shl, 'latitude': latitude, 'longitude': longitude, 'datum': datum, 'pdf_filename': data.get('pdf_filename', '')}
@@ -182,97 +355,151 @@ def _to_float(s: str | None) -> float | None:
     except ValueError:
         return None
 
-def parse_stimulation(page_text: str) -> list[dict]:
-    records = []
-    lines = page_text.splitlines()
+def _stim_record(lines: list[str]) -> tuple[dict | None, int]:
     n = len(lines)
-    i = 0
-    while i < n:
-        line = lines[i]
-        if not _STIM_HDR.search(line):
-            i += 1
-            continue
-        i += 1
-        while i < n and (not lines[i].strip() or _STIM_HDR.search(lines[i])):
-            i += 1
-        if i >= n:
+    it = enumerate(lines)
+    if next(dropwhile(lambda item: not _STIM_HDR.search(item[1]), it), None) is None:
+        return (None, n)
+    found = next(dropwhile(lambda item: not item[1].strip() or _STIM_HDR.search(item[1]), it), None)
+    if found is None:
+        return (None, n)
+    i, data_line = found
+    sm = _STIM_ROW.search(data_line) if '/' in data_line else None
+    if not sm:
+        return (None, i + 1)
+    rec: dict = {'date_stimulated': sm.group(1), 'formation': sm.group(2).strip(), 'top_ft': _to_float(sm.group(3)), 'bottom_ft': _to_float(sm.group(4)), 'stages': int(sm.group(5)), 'volume': _to_float(sm.group(6)), 'volume_units': sm.group(7), 'treatment_type': None, 'acid_percent': None, 'lbs_proppant': None, 'max_pressure': None, 'max_rate': None, 'details': None}
+    detail_parts: list[str] = []
+    in_details = False
+    end = n
+    for i, ln in it:
+        if _STIM_HDR.search(ln):
+            end = i
             break
-        data_line = lines[i]
-        sm = _STIM_ROW.search(data_line)
-        if not sm:
-            i += 1
+        if _TREAT_HDR.search(ln):
+            treat = next(dropwhile(lambda item: not item[1].strip(), it), None)
+            if treat is not None:
+                treat_line = treat[1].strip()
+                tm = _TREAT_ROW.match(treat_line) if treat_line[:1] in _ASCII_LETTERS else None
+                if tm:
+                    nums = [_to_float(tm.group(g)) for g in (2, 3, 4, 5)]
+                    non_none = [x for x in nums if x is not None]
+                    rec['treatment_type'] = tm.group(1).strip()
+                    if len(non_none) == 4:
+                        rec['acid_percent'] = non_none[0]
+                        rec['lbs_proppant'] = non_none[1]
+                        rec['max_pressure'] = non_none[2]
+                        rec['max_rate'] = non_none[3]
+                    elif len(non_none) == 3:
+                        rec['lbs_proppant'] = non_none[0]
+                        rec['max_pressure'] = non_none[1]
+                        rec['max_rate'] = non_none[2]
+                    elif len(non_none) >= 1:
+                        rec['lbs_proppant'] = non_none[0]
             continue
-        rec: dict = {'date_stimulated': sm.group(1), 'formation': sm.group(2).strip(), 'top_ft': _to_float(sm.group(3)), 'bottom_ft': _to_float(sm.group(4)), 'stages': int(sm.group(5)), 'volume': _to_float(sm.group(6)), 'volume_units': sm.group(7), 'treatment_type': None, 'acid_percent': None, 'lbs_proppant': None, 'max_pressure': None, 'max_rate': None, 'details': None}
-        i += 1
-        detail_parts: list[str] = []
-        in_details = False
-        while i < n:
-            ln = lines[i]
-            if _STIM_HDR.search(ln):
+        if _DETAILS.search(ln):
+            in_details = True
+            continue
+        if in_details and ln.strip():
+            detail_parts.append(ln.strip())
+    if detail_parts:
+        rec['details'] = '\n'.join(detail_parts)
+    return (rec, end)
+
+def parse_stimulation(page_text: str) -> list[dict]:
+    records = []
+    consumed = 0
+    for hdr in _STIM_HDR.finditer(page_text):
+        if hdr.start() < consumed:
+            continue
+        start = max(page_text.rfind('\n', 0, hdr.start()) + 1, consumed)
+        size = STIM_WINDOW_CHARS
+        while True:
+            window = page_text[start:start + size]
+            truncated = start + size < len(page_text)
+            raw_lines = window.splitlines(keepends=True)
+            lines = window.splitlines()
+            if truncated:
+                raw_lines.pop()
+                lines.pop()
+            rec, end = _stim_record(lines)
+            if end < len(lines) or not truncated:
                 break
-            if _TREAT_HDR.search(ln):
-                i += 1
-                while i < n and (not lines[i].strip()):
-                    i += 1
-                if i < n:
-                    tm = _TREAT_ROW.match(lines[i].strip())
-                    if tm:
-                        nums = [_to_float(tm.group(g)) for g in (2, 3, 4, 5)]
-                        non_none = [x for x in nums if x is not None]
-                        rec['treatment_type'] = tm.group(1).strip()
-                        if len(non_none) == 4:
-                            rec['acid_percent'] = non_none[0]
-                            rec['lbs_proppant'] = non_none[1]
-                            rec['max_pressure'] = non_none[2]
-                            rec['max_rate'] = non_none[3]
-                        elif len(non_none) == 3:
-                            rec['lbs_proppant'] = non_none[0]
-                            rec['max_pressure'] = non_none[1]
-                            rec['max_rate'] = non_none[2]
-                        elif len(non_none) >= 1:
-                            rec['lbs_proppant'] = non_none[0]
-                    i += 1
-                continue
-            if _DETAILS.search(ln):
-                in_details = True
-                i += 1
-                continue
-            if in_details and ln.strip():
-                detail_parts.append(ln.strip())
-            i += 1
-        if detail_parts:
-            rec['details'] = '\n'.join(detail_parts)
-        records.append(rec)
+            size *= 2
+        if rec:
+            records.append(rec)
+        consumed = start + sum((len(ln) for ln in raw_lines[:end]))
     return records
 
-def process_json(json_path: Path, conn: sqlite3.Connection) -> None:
-    with open(json_path, encoding='utf-8') as fh:
-        data = json.load(fh)
-    well = extract_well_row(data)
-    api_key = well['api_number']
-    conn.execute("\n        INSERT INTO wells\n          (api_number, well_name, well_number, operator, county, state,\n           shl_desc, latitude, longitude, datum, pdf_filename)\n        VALUES (?,?,?,?,?,?,?,?,?,?,?)\n        ON CONFLICT(api_number) DO UPDATE SET\n          well_name  = CASE\n                         WHEN LENGTH(excluded.well_name) > LENGTH(COALESCE(wells.well_name,''))\n                         THEN excluded.well_name\n                         ELSE wells.well_name\n                       END,\n          well_number = COALESCE(wells.well_number, excluded.well_number),\n          operator    = COALESCE(wells.operator,    excluded.operator),\n          county      = COALESCE(wells.county,      excluded.county),\n          shl_desc    = COALESCE(wells.shl_desc,    excluded.shl_desc),\n          latitude    = COALESCE(wells.latitude,    excluded.latitude),\n          longitude   = COALESCE(wells.longitude,   excluded.longitude),\n          datum       = COALESCE(wells.datum,       excluded.datum)\n        ", (well['api_number'], well['well_name'], well['well_number'], well['operator'], well['county'], well['state'], well['shl_desc'], well['latitude'], well['longitude'], well['datum'], well['pdf_filename']))
-    stim_count = 0
-    for page in data.get('pages', []):
-        text = page.get('text', '')
-        if not text or 'Date Stimulat' not in text:
+INSERT_WELL_SQL = "\n    INSERT INTO wells\n      (api_number, well_name, well_number, operator, county, state,\n       shl_desc, latitude, longitude, datum, pdf_filename)\n    VALUES (:api_number, :well_name, :well_number, :operator, :county, :state,\n            :shl_desc, :latitude, :longitude, :datum, :pdf_filename)\n    ON CONFLICT(api_number) DO UPDATE SET\n      well_name  = CASE\n                     WHEN LENGTH(excluded.well_name) > LENGTH(COALESCE(wells.well_name,''))\n                     THEN excluded.well_name\n                     ELSE wells.well_name\n                   END,\n      well_number = COALESCE(wells.well_number, excluded.well_number),\n      operator    = COALESCE(wells.operator,    excluded.operator),\n      county      = COALESCE(wells.county,      excluded.county),\n      shl_desc    = COALESCE(wells.shl_desc,    excluded.shl_desc),\n      latitude    = COALESCE(wells.latitude,    excluded.latitude),\n      longitude   = COALESCE(wells.longitude,   excluded.longitude),\n      datum       = COALESCE(wells.datum,       excluded.datum)\n    "
+STIM_COLUMNS = ('api_number', 'date_stimulated', 'formation', 'top_ft', 'bottom_ft', 'stages', 'volume', 'volume_units', 'treatment_type', 'acid_percent', 'lbs_proppant', 'max_pressure', 'max_rate', 'details')
+STIM_ROWS_PER_INSERT = 500 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999 // len(STIM_COLUMNS)
+SQLITE_PRAGMAS = ('PRAGMA journal_mode=WAL', 'PRAGMA synchronous=NORMAL', 'PRAGMA temp_store=MEMORY', 'PRAGMA cache_size=-200000')
+
+def configure_connection(conn: sqlite3.Connection) -> None:
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+
+@lru_cache(maxsize=None)
+def _stim_insert_sql(rows: int) -> str:
+    row = '(' + ','.join('?' * len(STIM_COLUMNS)) + ')'
+    return f"INSERT INTO stimulation ({', '.join(STIM_COLUMNS)}) VALUES " + ','.join([row] * rows)
+
+def parse_json(json_path: Path) -> tuple[dict, list[dict]]:
+    header, merged_fields, all_texts, page_fields = load_json(json_path)
+    well = build_well_row(header, merged_fields, all_texts, page_fields)
+    stims: list[dict] = []
+    for text in all_texts:
+        if 'Date Stimulat' not in text:
             continue
         for rec in parse_stimulation(text):
-            conn.execute('\n                INSERT INTO stimulation\n                  (api_number, date_stimulated, formation, top_ft, bottom_ft,\n                   stages, volume, volume_units, treatment_type, acid_percent,\n                   lbs_proppant, max_pressure, max_rate, details)\n                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)\n                ', (api_key, rec['date_stimulated'], rec['formation'], rec['top_ft'], rec['bottom_ft'], rec['stages'], rec['volume'], rec['volume_units'], rec['treatment_type'], rec['acid_percent'], rec['lbs_proppant'], rec['max_pressure'], rec['max_rate'], rec['details']))
-            stim_count += 1
-    stim_note = f', {stim_count} stim row(s)' if stim_count else ''
-    print(f'  {json_path.name:50s}  →  {api_key}{stim_note}')
+            rec['api_number'] = well['api_number']
+            stims.append(rec)
+    return (well, stims)
+
+def flush_rows(conn: sqlite3.Connection, wells: list[dict], stims: list[dict]) -> None:
+    if wells:
+        conn.executemany(INSERT_WELL_SQL, wells)
+        wells.clear()
+    for start in range(0, len(stims), STIM_ROWS_PER_INSERT):
+        chunk = stims[start:start + STIM_ROWS_PER_INSERT]
+        conn.execute(_stim_insert_sql(len(chunk)), [rec[col] for rec in chunk for col in STIM_COLUMNS])
+    stims.clear()
+
+def list_json_files(directory: str) -> list[tuple[Path, int]]:
+    try:
+        with os.scandir(directory) as it:
+            entries = [(Path(e.path), e.stat().st_size) for e in it if e.name.endswith('.json')]
+    except FileNotFoundError:
+        return []
+    entries.sort()
+    return entries
 
 def main() -> None:
-    json_files = sorted(Path(EXTRACTED_DIR).glob('*.json'))
+    entries = list_json_files(EXTRACTED_DIR)
+    json_files = [path for path, _ in entries]
     if not json_files:
         print(f"No JSON files found in '{EXTRACTED_DIR}/'. Run extract_data.py first.")
         return
     print(f"Found {len(json_files)} JSON file(s) in '{EXTRACTED_DIR}/'\n")
     conn = sqlite3.connect(DB_PATH)
+    configure_connection(conn)
     create_tables(conn)
-    for path in json_files:
-        process_json(path, conn)
+    wells: list[dict] = []
+    stims: list[dict] = []
+    conn.execute('BEGIN')
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {path: executor.submit(parse_json, path) for path, _ in sorted(entries, key=lambda e: -e[1])}
+        for path in json_files:
+            well, well_stims = futures[path].result()
+            stim_note = f', {len(well_stims)} stim row(s)' if well_stims else ''
+            print(f"  {path.name:50s}  →  {well['api_number']}{stim_note}")
+            wells.append(well)
+            stims.extend(well_stims)
+            if len(wells) >= BATCH_SIZE or len(stims) >= BATCH_SIZE:
+                flush_rows(conn, wells, stims)
+    flush_rows(conn, wells, stims)
     conn.commit()
+    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
     conn.close()
     conn2 = sqlite3.connect(DB_PATH)
     w_count = conn2.execute('SELECT COUNT(*) FROM wells').fetchone()[0]
@@ -3,19 +3,60 @@ import argparse
 import sys
 import re
 import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml
+    LXML_AVAILABLE = True
+except Exception:
+    LXML_AVAILABLE = False
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    SELENIUM_AVAILABLE = True
+except Exception:
+    SELENIUM_AVAILABLE = False
+try:
+    from requests_cache import CachedSession
+    REQUESTS_CACHE_AVAILABLE = True
+except Exception:
+    REQUESTS_CACHE_AVAILABLE = False
 BASE_URL = 'https://www.drillingedge.com'
 SEARCH_URL = f'{BASE_URL}/search'
 HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'}
 TEXT_COLUMNS = {'well_status': "TEXT DEFAULT 'N/A'", 'well_type': "TEXT DEFAULT 'N/A'", 'closest_city': "TEXT DEFAULT 'N/A'"}
 NUM_COLUMNS = {'barrels_oil_produced': 'REAL DEFAULT 0', 'gas_produced': 'REAL DEFAULT 0'}
 EXTRA_COLUMNS = {'drillingedge_url': "TEXT DEFAULT 'N/A'"}
+HTTP_CACHE_PATH = 'drillingedge_http.sqlite'
+HTTP_CACHE_SECONDS = 24 * 3600
+DEAD_STATUS_CODES = {404, 410}
+DEAD_URLS: set[str] = set()
+DEAD_PREFIXES: set[str] = set()
+SELENIUM_BLOCKED_URLS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.woff', '*.woff2', '*.css', '*googletag*', '*analytics*', '*doubleclick*']
+MISSING_WHERE = "well_status IS NULL OR TRIM(well_status)='' OR well_status='N/A' OR well_type IS NULL OR TRIM(well_type)='' OR well_type='N/A' OR closest_city IS NULL OR TRIM(closest_city)='' OR closest_city='N/A' OR barrels_oil_produced IS NULL OR barrels_oil_produced=0 OR gas_produced IS NULL OR gas_produced=0"
+INDEX_DDL = (f'CREATE INDEX IF NOT EXISTS idx_wells_missing ON wells(api_number) WHERE {MISSING_WHERE}',)
 FIELD_LABELS = {'well_status': ['well\\s*status'], 'well_type': ['well\\s*type', 'well\\s*purpose'], 'closest_city': ['closest\\s*city', 'nearest\\s*city'], 'barrels_oil_produced': ['barrels?\\s+of\\s+oil\\s+produced', 'oil\\s+produced', 'cumulative\\s+oil', 'oil\\s+production', 'total\\s+oil\\s+prod', 'oil\\s+prod'], 'gas_produced': ['gas\\s+produced', 'cumulative\\s+gas', 'gas\\s+production', 'total\\s+gas\\s+prod', 'gas\\s+prod']}
+FIELD_LABEL_UNION = {field: re.compile(f'\\b(?:{'|'.join(pats)})\\b', re.I) for field, pats in FIELD_LABELS.items()}
+FIELD_TEXT_RES = {field: [re.compile(f'{p}\\s*:?\\s*([^\\n|]+)', re.I) for p in pats] for field, pats in FIELD_LABELS.items()}
+TOWNSHIP_RE = re.compile('\\b\\d+\\s*N\\s+\\d+\\s*W\\b', re.I)
+NUMERIC_RE = re.compile('(-?\\d+(?:,\\d{3})*(?:\\.\\d+)?)\\s*([kmb])?', re.I)
+COLON_RE = re.compile(':')
+SLUG_RE = re.compile('[^a-z0-9]+')
+NAME_TOKEN_RE = re.compile('[a-z0-9]+')
+COUNTY_WORD_RE = re.compile('\\bcounty\\b')
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+SEARCH_LINK_STRAINER = SoupStrainer('a', href=True)
+PROD_UNIT_RE = re.compile('\\b(bbl|barrel|mcf|mmcf|bcf|mmbtu|gas|oil)\\b', re.I)
 
 @dataclass
 class ScrapedRecord:
@@ -29,7 +70,7 @@ class ScrapedRecord:
 def normalize_text(s: str | None) -> str:
     if not s:
         return ''
-    return re.sub('\\s+', ' ', s).strip()
+    return ' '.join(s.split())
 
 def normalize_numeric(raw: str | None) -> float:
     if not raw:
@@ -37,7 +78,7 @@ def normalize_numeric(raw: str | None) -> float:
     s = normalize_text(raw)
     if not s or s.lower() in {'n/a', 'na', 'none', '-', '--'}:
         return 0.0
-    m = re.search('(-?\\d+(?:,\\d{3})*(?:\\.\\d+)?)\\s*([kmb])?', s, re.I)
+    m = NUMERIC_RE.search(s)
     if not m:
         return 0.0
     num = float(m.group(1).replace(',', ''))
@@ -58,12 +99,12 @@ def production_numeric(raw: str | None) -> float:
         return 0.0
     if 'members only' in s.lower():
         return 0.0
-    if re.search('\\b\\d+\\s*N\\s+\\d+\\s*W\\b', s, re.I):
+    if TOWNSHIP_RE.search(s):
         return 0.0
     val = normalize_numeric(s)
     if val == 0:
         return 0.0
-    has_prod_unit = bool(re.search('\\b(bbl|barrel|mcf|mmcf|bcf|mmbtu|gas|oil)\\b', s, re.I))
+    has_prod_unit = bool(PROD_UNIT_RE.search(s))
     if not has_prod_unit and 1900 <= val <= 2100:
         return 0.0
     return val
@@ -72,7 +113,7 @@ def sanitize_status(raw: str | None) -> str:
     s = normalize_text(raw)
     if not s:
         return 'N/A'
-    if re.search('\\b\\d+\\s*N\\s+\\d+\\s*W\\b', s, re.I):
+    if TOWNSHIP_RE.search(s):
         return 'N/A'
     return s
 
@@ -80,12 +121,20 @@ def sanitize_city(raw: str | None) -> str:
     s = normalize_text(raw)
     if not s:
         return 'N/A'
-    if re.search('\\b\\d+\\s*N\\s+\\d+\\s*W\\b', s, re.I):
+    if TOWNSHIP_RE.search(s):
         return 'N/A'
     return s
 
+class DigitsOnlyTable(dict):
+
+    def __missing__(self, key: int) -> int | None:
+        value = key if chr(key).isdecimal() else None
+        self[key] = value
+        return value
+DIGITS_ONLY_TABLE = DigitsOnlyTable()
+
 def api_digits(api_number: str | None) -> str:
-    return re.sub('\\D', '', api_number or '')
+    return (api_number or '').translate(DIGITS_ONLY_TABLE)
 
 def canonical_api(api_number: str | None) -> str:
     d = api_digits(api_number)
@@ -100,24 +149,26 @@ def canonical_api(api_number: str | None) -> str:
     return normalize_text(api_number)
 
 def name_tokens(well_name: str | None) -> list[str]:
-    tokens = re.findall('[a-z0-9]+', (well_name or '').lower())
+    tokens = NAME_TOKEN_RE.findall((well_name or '').lower())
     return [t for t in tokens if len(t) > 2]
 
 def slugify(value: str | None) -> str:
     s = normalize_text(value).lower()
     s = s.replace('&', ' and ')
-    s = re.sub('[^a-z0-9]+', '-', s)
+    s = SLUG_RE.sub('-', s)
     return s.strip('-')
 
+@lru_cache(maxsize=None)
 def state_slug(state: str | None) -> str:
     s = normalize_text(state).lower()
     if s in {'nd', 'north dakota'}:
         return 'north-dakota'
     return slugify(s)
 
+@lru_cache(maxsize=None)
 def county_slug(county: str | None) -> str:
     c = normalize_text(county).lower()
-    c = re.sub('\\bcounty\\b', '', c).strip()
+    c = COUNTY_WORD_RE.sub('', c).strip()
     if not c:
         return ''
     return f'{slugify(c)}-county'
@@ -127,13 +178,15 @@ def ensure_columns(conn: sqlite3.Connection) -> None:
     for col, ddl in (TEXT_COLUMNS | NUM_COLUMNS | EXTRA_COLUMNS).items():
         if col not in existing:
             conn.execute(f'ALTER TABLE wells ADD COLUMN {col} {ddl}')
+    for ddl in INDEX_DDL:
+        conn.execute(ddl)
     conn.commit()
 
 def load_wells(conn: sqlite3.Connection, limit: int | None=None, offset: int=0, only_missing: bool=True) -> list[sqlite3.Row]:
     conn.row_factory = sqlite3.Row
     where = ''
     if only_missing:
-        where = "WHERE well_status IS NULL OR TRIM(well_status)='' OR well_status='N/A' OR well_type IS NULL OR TRIM(well_type)='' OR well_type='N/A' OR closest_city IS NULL OR TRIM(closest_city)='' OR closest_city='N/A' OR barrels_oil_produced IS NULL OR barrels_oil_produced=0 OR gas_produced IS NULL OR gas_produced=0"
+        where = f'WHERE {MISSING_WHERE}'
     sql = f'SELECT api_number, well_name FROM wells {where} ORDER BY api_number LIMIT ? OFFSET ?'
     sql = sql.replace('SELECT api_number, well_name', 'SELECT api_number, well_name, county, state')
     lim = -1 if limit is None else limit
@@ -158,56 +211,74 @@ def build_queries(api_number: str | None, well_name: str | None) -> list[str]:
             seen.add(key)
     return out
 
-def extract_label_value_pairs(soup: BeautifulSoup) -> dict[str, str]:
-    pairs: dict[str, str] = {}
-    for th in soup.find_all('th'):
-        td = th.find_next_sibling('td')
-        if td:
-            label = normalize_text(th.get_text(' ', strip=True)).lower()
-            value = normalize_text(td.get_text(' ', strip=True))
-            if label and value:
-                pairs[label] = value
-    for dt in soup.select('dt'):
-        dd = dt.find_next_sibling('dd')
-        if dd:
-            label = normalize_text(dt.get_text(' ', strip=True)).lower()
-            value = normalize_text(dd.get_text(' ', strip=True))
-            if label and value:
-                pairs[label] = value
-    for node in soup.find_all(string=re.compile(':')):
-        text = normalize_text(str(node))
-        if ':' not in text:
+def _match_open_fields(label: str, targets: dict[str, re.Pattern[str]], found: dict[str, str]) -> list[str]:
+    return [field for field, pattern in targets.items() if field not in found and pattern.search(label)]
+
+def extract_target_fields(soup: BeautifulSoup, targets: dict[str, re.Pattern[str]], text_targets: dict[str, list[re.Pattern[str]]]) -> dict[str, str | None]:
+    found: dict[str, str] = {}
+    values: dict[str, str] = {}
+    for label_name, value_name in (('th', 'td'), ('dt', 'dd')):
+        for label_tag in soup.find_all(label_name):
+            value_tag = label_tag.find_next_sibling(value_name)
+            if not value_tag:
+                continue
+            label = normalize_text(label_tag.get_text(' ', strip=True)).lower()
+            if label in values:
+                value = normalize_text(value_tag.get_text(' ', strip=True))
+                if value:
+                    values[label] = value
+                continue
+            if not label:
+                continue
+            fields = _match_open_fields(label, targets, found)
+            if not fields:
+                continue
+            value = normalize_text(value_tag.get_text(' ', strip=True))
+            if not value:
+                continue
+            values[label] = value
+            for field in fields:
+                found[field] = label
+    if len(found) < len(targets):
+        for node in soup.find_all(string=COLON_RE):
+            text = normalize_text(str(node))
+            if ':' not in text:
+                continue
+            left, right = text.split(':', 1)
+            label = normalize_text(left).lower()
+            value = normalize_text(right)
+            if not (label and value and len(label) < 80) or label in values:
+                continue
+            fields = _match_open_fields(label, targets, found)
+            if not fields:
+                continue
+            values[label] = value
+            for field in fields:
+                found[field] = label
+            if len(found) == len(targets):
+                break
+    out: dict[str, str | None] = {}
+    page_text = None
+    for field in targets:
+        if field in found:
+            out[field] = values[found[field]]
             continue
-        left, right = text.split(':', 1)
-        label = normalize_text(left).lower()
-        value = normalize_text(right)
-        if label and value and (len(label) < 80):
-            pairs.setdefault(label, value)
-    return pairs
-
-def extract_field(soup: BeautifulSoup, pairs: dict[str, str], labels: Iterable[str]) -> str | None:
-    for label_key, value in pairs.items():
-        for pattern in labels:
-            if re.search(f'\\b{pattern}\\b', label_key, re.I):
-                return value
-    text = soup.get_text('\n', strip=True)
-    for pattern in labels:
-        m = re.search(f'{pattern}\\s*:?\\s*([^\\n|]+)', text, re.I)
-        if m:
-            value = normalize_text(m.group(1))
-            if value:
-                return value
-    return None
+        out[field] = None
+        if page_text is None:
+            page_text = soup.get_text('\n', strip=True)
+        for pattern in text_targets[field]:
+            m = pattern.search(page_text)
+            if m:
+                value = normalize_text(m.group(1))
+                if value:
+                    out[field] = value
+                    break
+    return out
 
 def parse_well_page(html: str, url: str) -> ScrapedRecord:
-    soup = BeautifulSoup(html, 'html.parser')
-    pairs = extract_label_value_pairs(soup)
-    status = extract_field(soup, pairs, FIELD_LABELS['well_status']) or 'N/A'
-    wtype = extract_field(soup, pairs, FIELD_LABELS['well_type']) or 'N/A'
-    city = extract_field(soup, pairs, FIELD_LABELS['closest_city']) or 'N/A'
-    oil = extract_field(soup, pairs, FIELD_LABELS['barrels_oil_produced'])
-    gas = extract_field(soup, pairs, FIELD_LABELS['gas_produced'])
-    return ScrapedRecord(well_status=sanitize_status(status), well_type=normalize_text(wtype) or 'N/A', closest_city=sanitize_city(city), barrels_oil_produced=production_numeric(oil), gas_produced=production_numeric(gas), drillingedge_url=url or 'N/A')
+    soup = BeautifulSoup(html, HTML_PARSER)
+    fields = extract_target_fields(soup, FIELD_LABEL_UNION, FIELD_TEXT_RES)
+    return ScrapedRecord(well_status=sanitize_status(fields['well_status'] or 'N/A'), well_type=normalize_text(fields['well_type'] or 'N/A') or 'N/A', closest_city=sanitize_city(fields['closest_city'] or 'N/A'), barrels_oil_produced=production_numeric(fields['barrels_oil_produced']), gas_produced=production_numeric(fields['gas_produced']), drillingedge_url=url or 'N/A')
 
 def direct_well_urls(api_number: str | None, well_name: str | None, county: str | None, state: str | None) -> list[str]:
     api = canonical_api(api_number)
@@ -223,39 +294,56 @@ def direct_well_urls(api_number: str | None, well_name: str | None, county: str
     urls.append(f'{BASE_URL}/wells/{name_slug}/{api}')
     return urls
 
+def well_path_prefix(url: str) -> str:
+    return url.rsplit('/wells/', 1)[0]
+
+def is_dead_url(url: str) -> bool:
+    return url in DEAD_URLS or well_path_prefix(url) in DEAD_PREFIXES
+
 def fetch_direct_well_page(session: requests.Session, api_number: str | None, well_name: str | None, county: str | None, state: str | None, timeout: int=25) -> ScrapedRecord | None:
     api = canonical_api(api_number)
+    missed: list[str] = []
     for url in direct_well_urls(api, well_name, county, state):
+        if is_dead_url(url):
+            continue
         try:
             res = session.get(url, headers=HEADERS, timeout=timeout)
         except requests.RequestException:
             continue
+        if res.status_code in DEAD_STATUS_CODES:
+            DEAD_URLS.add(url)
+            missed.append(well_path_prefix(url))
         if res.status_code != 200:
             continue
         text = res.text.lower()
         if 'well summary' not in text and 'well details' not in text and (api and api not in text):
             continue
+        DEAD_PREFIXES.update(missed)
         return parse_well_page(res.text, url)
     return None
 
+@lru_cache(maxsize=256)
+def score_terms(api_number: str | None, well_name: str | None, query: str) -> tuple[str, str, tuple[str, ...]]:
+    return (api_digits(api_number), normalize_text(query).lower(), tuple(name_tokens(well_name)))
+
 def score_result(href: str, title: str, api_number: str | None, well_name: str | None, query: str) -> int:
     score = 0
     blob = f'{href} {title}'.lower()
-    digits = api_digits(api_number)
-    if digits and digits in re.sub('\\D', '', blob):
+    digits, q, tokens = score_terms(api_number, well_name, query)
+    if digits and digits in blob.translate(DIGITS_ONLY_TABLE):
         score += 100
-    q = normalize_text(query).lower()
     if q and q in blob:
         score += 15
-    for tok in name_tokens(well_name):
+    for tok in tokens:
         if tok in blob:
             score += 2
     return score
 
 def best_search_result(html: str, api_number: str | None, well_name: str | None, query: str) -> str | None:
-    soup = BeautifulSoup(html, 'html.parser')
-    candidates: list[tuple[int, str]] = []
-    for a in soup.select('a[href]'):
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=SEARCH_LINK_STRAINER)
+    best_score = 0
+    best_url = None
+    for a in soup.find_all('a', href=True):
         href = a.get('href', '')
         if not href:
             continue
@@ -264,13 +352,9 @@ def best_search_result(html: str, api_number: str | None, well_name: str | None,
         full_url = urljoin(BASE_URL, href)
         title = normalize_text(a.get_text(' ', strip=True))
         score = score_result(full_url, title, api_number, well_name, query)
-        candidates.append((score, full_url))
-    if not candidates:
-        return None
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    best_score, best_url = candidates[0]
-    if best_score <= 0:
-        return None
+        if score > best_score:
+            best_score = score
+            best_url = full_url
     return best_url
 
 def fetch_with_requests(session: requests.Session, api_number: str | None, well_name: str | None, county: str | None, state: str | None, timeout: int=25) -> ScrapedRecord | None:
@@ -298,25 +382,51 @@ def fetch_with_requests(session: requests.Session, api_number: str | None, well_
             return parse_well_page(well_res.text, maybe_url)
     return None
 
-def fetch_with_selenium(api_number: str | None, well_name: str | None, county: str | None, state: str | None, headless: bool=True) -> ScrapedRecord | None:
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
-    except Exception:
-        return None
-    options = webdriver.ChromeOptions()
-    if headless:
-        options.add_argument('--headless=new')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--window-size=1400,2000')
-    options.add_argument(f'user-agent={HEADERS['User-Agent']}')
-    driver = webdriver.Chrome(options=options)
-    try:
+class SeleniumDriver:
+
+    def __init__(self, headless: bool=True) -> None:
+        self.headless = headless
+        self.driver = None
+
+    def __enter__(self) -> SeleniumDriver:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def start(self) -> bool:
+        if self.driver is not None:
+            return True
+        if not SELENIUM_AVAILABLE:
+            return False
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument('--headless=new')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--window-size=1400,2000')
+        options.add_argument(f'user-agent={HEADERS['User-Agent']}')
+        options.page_load_strategy = 'eager'
+        self.driver = webdriver.Chrome(options=options)
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': SELENIUM_BLOCKED_URLS})
+        except Exception:
+            pass
+        return True
+
+    def fetch(self, api_number: str | None, well_name: str | None, county: str | None, state: str | None) -> ScrapedRecord | None:
+        if not self.start():
+            return None
+        driver = self.driver
         for url in direct_well_urls(api_number, well_name, county, state):
+            if is_dead_url(url):
+                continue
             driver.get(url)
             time.sleep(1.0)
             html = driver.page_source
@@ -346,16 +456,62 @@ def fetch_with_selenium(api_number: str | None, well_name: str | None, county: s
             driver.get(best_url)
             wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
             return parse_well_page(driver.page_source, best_url)
-    finally:
-        driver.quit()
-    return None
+        return None
 
-def store_record(conn: sqlite3.Connection, api_number: str, rec: ScrapedRecord) -> None:
-    conn.execute('\n        UPDATE wells\n           SET well_status = ?,\n               well_type = ?,\n               closest_city = ?,\n               barrels_oil_produced = ?,\n               gas_produced = ?,\n               drillingedge_url = ?\n         WHERE api_number = ?\n        ', (rec.well_status or 'N/A', rec.well_type or 'N/A', rec.closest_city or 'N/A', rec.barrels_oil_produced if rec.barrels_oil_produced is not None else 0, rec.gas_produced if rec.gas_produced is not None else 0, rec.drillingedge_url or 'N/A', api_number))
+def fetch_with_selenium(api_number: str | None, well_name: str | None, county: str | None, state: str | None, headless: bool=True) -> ScrapedRecord | None:
+    with SeleniumDriver(headless=headless) as selenium:
+        return selenium.fetch(api_number, well_name, county, state)
+
+UPDATE_WELL_SQL = '\n    UPDATE wells\n       SET well_status = ?,\n           well_type = ?,\n           closest_city = ?,\n           barrels_oil_produced = ?,\n           gas_produced = ?,\n           drillingedge_url = ?\n     WHERE api_number = ?\n    '
+UPDATE_BATCH_SIZE = 200
+SQLITE_PRAGMAS = ('PRAGMA journal_mode=WAL', 'PRAGMA synchronous=NORMAL')
+
+def store_record(api_number: str, rec: ScrapedRecord) -> tuple[str, str, str, float, float, str, str]:
+    return (rec.well_status or 'N/A', rec.well_type or 'N/A', rec.closest_city or 'N/A', rec.barrels_oil_produced if rec.barrels_oil_produced is not None else 0, rec.gas_produced if rec.gas_produced is not None else 0, rec.drillingedge_url or 'N/A', api_number)
+
+def flush_updates(conn: sqlite3.Connection, pending: list[tuple[str, str, str, float, float, str, str]]) -> None:
+    if pending:
+        conn.executemany(UPDATE_WELL_SQL, pending)
+        conn.commit()
+        pending.clear()
+
+class RateLimiter:
+
+    def __init__(self, interval: float) -> None:
+        self.interval = max(0.0, interval)
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+def fetch_throttled(session: requests.Session, limiter: RateLimiter, api_number: str | None, well_name: str | None, county: str | None, state: str | None) -> ScrapedRecord | None:
+    limiter.wait()
+    return fetch_with_requests(session, api_number, well_name, county, state)
+
+def build_session(pool_size: int, http_cache: bool=True) -> requests.Session:
+    if http_cache and REQUESTS_CACHE_AVAILABLE:
+        session = CachedSession(HTTP_CACHE_PATH, backend='sqlite', expire_after=HTTP_CACHE_SECONDS, allowable_methods=('GET',))
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(32, pool_size))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 def check_connectivity(session: requests.Session, timeout: int=15) -> bool:
     try:
-        res = session.get(BASE_URL, headers=HEADERS, timeout=timeout)
+        if hasattr(session, 'cache_disabled'):
+            with session.cache_disabled():
+                res = session.get(BASE_URL, headers=HEADERS, timeout=timeout)
+        else:
+            res = session.get(BASE_URL, headers=HEADERS, timeout=timeout)
         return res.status_code < 500
     except requests.RequestException:
         return False
@@ -365,42 +521,61 @@ def main() -> None:
     parser.add_argument('--db', default='oil_wells.db', help='Path to SQLite DB.')
     parser.add_argument('--limit', type=int, default=None, help='Max wells to process.')
     parser.add_argument('--offset', type=int, default=0, help='Start offset.')
-    parser.add_argument('--sleep', type=float, default=0.7, help='Seconds between wells.')
+    parser.add_argument('--sleep', type=float, default=0.7, help='Minimum seconds between starting wells, shared across workers.')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent HTTP fetch workers.')
+    parser.add_argument('--no-http-cache', action='store_true', help='Bypass the on-disk HTTP response cache.')
     parser.add_argument('--no-only-missing', action='store_true', help='Process all wells, not just missing scraped fields.')
     parser.add_argument('--no-selenium-fallback', action='store_true', help='Disable Selenium fallback when requests parsing fails.')
     parser.add_argument('--selenium-headed', action='store_true', help='Run Selenium in headed mode (debugging).')
     args = parser.parse_args()
     conn = sqlite3.connect(args.db)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
     ensure_columns(conn)
     rows = load_wells(conn, limit=args.limit, offset=args.offset, only_missing=not args.no_only_missing)
     print(f'Loaded {len(rows)} wells to scrape from {args.db}')
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    workers = max(1, args.workers)
+    session = build_session(workers, http_cache=not args.no_http_cache)
     if not check_connectivity(session):
         print('ERROR: Cannot reach https://www.drillingedge.com from this environment. Stopping to avoid writing default values for every well.')
         sys.exit(1)
+    limiter = RateLimiter(args.sleep)
     ok = 0
     miss = 0
-    for idx, row in enumerate(rows, start=1):
-        api = row['api_number']
-        name = row['well_name']
-        county = row['county']
-        state = row['state']
-        print(f'[{idx}/{len(rows)}] {api} | {name}')
-        record = fetch_with_requests(session, api, name, county, state)
-        if not record and (not args.no_selenium_fallback):
-            record = fetch_with_selenium(api, name, county, state, headless=not args.selenium_headed)
-        if not record:
-            record = ScrapedRecord()
-            miss += 1
-            print('  -> no match found; storing defaults')
-        else:
-            ok += 1
-            print(f'  -> status={record.well_status}, type={record.well_type}, city={record.closest_city}, oil={record.barrels_oil_produced}, gas={record.gas_produced}')
-        store_record(conn, api, record)
+    pending = []
+    try:
+        with SeleniumDriver(headless=not args.selenium_headed) as selenium:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = {pool.submit(fetch_throttled, session, limiter, row['api_number'], row['well_name'], row['county'], row['state']): row for row in rows}
+                for idx, future in enumerate(as_completed(futures), start=1):
+                    row = futures[future]
+                    api = row['api_number']
+                    name = row['well_name']
+                    county = row['county']
+                    state = row['state']
+                    print(f'[{idx}/{len(rows)}] {api} | {name}')
+                    record = future.result()
+                    if not record and (not args.no_selenium_fallback):
+                        record = selenium.fetch(api, name, county, state)
+                    if not record:
+                        record = ScrapedRecord()
+                        miss += 1
+                        print('  -> no match found; storing defaults')
+                    else:
+                        ok += 1
+                        print(f'  -> status={record.well_status}, type={record.well_type}, city={record.closest_city}, oil={record.barrels_oil_produced}, gas={record.gas_produced}')
+                    pending.append(store_record(api, record))
+                    if len(pending) >= UPDATE_BATCH_SIZE:
+                        flush_updates(conn, pending)
+            finally:
+                pool.shutdown(cancel_futures=True)
+    finally:
+        flush_updates(conn, pending)
+        conn.execute('ANALYZE')
         conn.commit()
-        time.sleep(max(0.0, args.sleep))
-    conn.close()
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        conn.close()
     print(f'Done. Scraped={ok}, defaulted={miss}, total={len(rows)}')
 if __name__ == '__main__':
     main()